@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Run every test script in parallel, each in its own Python process.
+
+The test scripts are independent and drive themselves from their
+__main__ blocks, so each one runs as a subprocess: a failure or leftover
+pygame state in one script can't affect another. Output is captured and
+only shown for scripts that fail.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+
+def find_test_scripts():
+    """(script, working directory) pairs. Root scripts run from the repo root;
+    scripts inside src/ expect to run from src/ for their relative paths."""
+    scripts = [(path, ROOT) for path in sorted(ROOT.glob('test_*.py'))]
+    scripts += [(path, ROOT / 'src') for path in sorted((ROOT / 'src').glob('test_*.py'))]
+    return scripts
+
+
+def run_script(script, cwd):
+    result = subprocess.run([sys.executable, str(script)], cwd=cwd,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return script, result.returncode, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the BrainMaze test scripts in parallel')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='Number of test scripts to run at once (default: CPU count)')
+    args = parser.parse_args()
+
+    scripts = find_test_scripts()
+    failed = []
+    # Threads are enough here: each one just waits on its subprocess
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        for script, returncode, output in executor.map(lambda job: run_script(*job), scripts):
+            name = script.relative_to(ROOT)
+            if returncode == 0:
+                print(f"✓ {name}")
+            else:
+                print(f"✗ {name} (exit code {returncode})")
+                failed.append((name, output))
+
+    for name, output in failed:
+        print(f"\n{'=' * 60}\n{name}\n{'=' * 60}")
+        print(output, end='')
+
+    print(f"\n{len(scripts) - len(failed)}/{len(scripts)} test scripts passed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -137,6 +137,11 @@ class PatrolBehavior(Behavior):
         self.cached_path = None
         self.path_index = 0
 
+        # Paths already found, keyed by (start_x, start_y, target_x, target_y).
+        # The maze and waypoints are fixed for the behavior's lifetime, so each
+        # leg of the patrol loop only needs a BFS on the first lap.
+        self._path_cache = {}
+
     def _calculate_quadrant_waypoints(self):
         """
         Calculate waypoints at the centers of the 4 quadrants.
@@ -221,12 +226,17 @@ class PatrolBehavior(Behavior):
 
         # Check if we need to calculate a new path
         if self.cached_path is None or self.path_index >= len(self.cached_path):
-            # Calculate new path using BFS
-            self.cached_path = find_path_bfs(
-                enemy_x, enemy_y,
-                target_x, target_y,
-                self._is_walkable
-            )
+            # Reuse the path from an earlier lap, or calculate it using BFS
+            key = (enemy_x, enemy_y, target_x, target_y)
+            if key in self._path_cache:
+                self.cached_path = self._path_cache[key]
+            else:
+                self.cached_path = find_path_bfs(
+                    enemy_x, enemy_y,
+                    target_x, target_y,
+                    self._is_walkable
+                )
+                self._path_cache[key] = self.cached_path
             self.path_index = 0
 
             # If no path found, stay still
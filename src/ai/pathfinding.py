@@ -7,6 +7,16 @@ Greedy methods kept for backward compatibility.
 from typing import Tuple, Optional, List
 from collections import deque
 
+# (name, dx, dy) for each move, in the order searches try them
+DIRECTIONS = (
+    ('up', 0, -1),
+    ('down', 0, 1),
+    ('left', -1, 0),
+    ('right', 1, 0)
+)
+DIRECTION_NAMES = tuple(name for name, _, _ in DIRECTIONS)
+NEIGHBOR_OFFSETS = tuple((dx, dy) for _, dx, dy in DIRECTIONS)
+
 
 def find_path_bfs(
     start_x: int,
@@ -36,31 +46,32 @@ def find_path_bfs(
     if start_x == target_x and start_y == target_y:
         return []
 
-    # BFS setup
-    queue = deque([(start_x, start_y, [])])  # (x, y, path_so_far)
-    visited = {(start_x, start_y)}
-
-    # Direction mappings
-    directions = [
-        ('up', 0, -1),
-        ('down', 0, 1),
-        ('left', -1, 0),
-        ('right', 1, 0)
-    ]
+    # BFS setup. Each visited tile maps to the tile and direction it was
+    # reached from, so queued entries don't carry (and copy) a whole path;
+    # the path is walked back from the target once it is found.
+    queue = deque([(start_x, start_y)])
+    came_from = {(start_x, start_y): None}
 
     while queue:
-        x, y, path = queue.popleft()
+        x, y = queue.popleft()
 
         # Try all 4 directions
-        for direction_name, dx, dy in directions:
+        for direction_name, dx, dy in DIRECTIONS:
             nx, ny = x + dx, y + dy
 
             # Check if we reached the target
             if nx == target_x and ny == target_y:
-                return path + [direction_name]
+                path = [direction_name]
+                step = came_from[(x, y)]
+                while step is not None:
+                    previous, direction_name = step
+                    path.append(direction_name)
+                    step = came_from[previous]
+                path.reverse()
+                return path
 
             # Skip if already visited
-            if (nx, ny) in visited:
+            if (nx, ny) in came_from:
                 continue
 
             # Skip if not walkable
@@ -68,8 +79,8 @@ def find_path_bfs(
                 continue
 
             # Add to queue and mark as visited
-            visited.add((nx, ny))
-            queue.append((nx, ny, path + [direction_name]))
+            came_from[(nx, ny)] = ((x, y), direction_name)
+            queue.append((nx, ny))
 
     # No path found
     return None
@@ -139,12 +150,11 @@ def get_direction_towards_target(
 
     # Both axes blocked - try perpendicular directions
     # Get all perpendicular directions to primary
-    all_directions = ['up', 'down', 'left', 'right']
     tried = {primary}
     if secondary:
         tried.add(secondary)
 
-    remaining = [d for d in all_directions if d not in tried]
+    remaining = [d for d in DIRECTION_NAMES if d not in tried]
 
     # Use position-based deterministic ordering instead of random shuffle
     # Sort by a deterministic pattern based on current position
@@ -212,34 +222,40 @@ def find_nearest_walkable_tile(maze, target_x: int, target_y: int, max_search_ra
     if not maze.is_wall(target_x, target_y):
         return (target_x, target_y)
 
-    # BFS to find nearest walkable tile
-    visited = set()
-    queue = [(target_x, target_y, 0)]  # (x, y, distance)
-    visited.add((target_x, target_y))
+    # BFS to find nearest walkable tile. Visited cells are flagged in a flat
+    # bytearray indexed y * n + x; the target itself is never re-queued since
+    # only in-bounds neighbours are, and it is marked too when it is in bounds.
+    n = maze.grid_size
+    is_wall = maze.is_wall
+    visited = bytearray(n * n)
+    if 0 <= target_x < n and 0 <= target_y < n:
+        visited[target_y * n + target_x] = 1
+    queue = deque([(target_x, target_y, 0)])  # (x, y, distance)
 
     while queue:
-        x, y, dist = queue.pop(0)
+        x, y, dist = queue.popleft()
 
         # Check if we've exceeded max search radius
         if dist > max_search_radius:
             break
 
         # Check all 4 neighbors
-        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+        for dx, dy in NEIGHBOR_OFFSETS:
             nx, ny = x + dx, y + dy
 
             # Check bounds
-            if nx < 0 or nx >= maze.grid_size or ny < 0 or ny >= maze.grid_size:
+            if nx < 0 or nx >= n or ny < 0 or ny >= n:
                 continue
 
             # Skip if visited
-            if (nx, ny) in visited:
+            index = ny * n + nx
+            if visited[index]:
                 continue
 
-            visited.add((nx, ny))
+            visited[index] = 1
 
             # If walkable, return it
-            if not maze.is_wall(nx, ny):
+            if not is_wall(nx, ny):
                 return (nx, ny)
 
             # Add to queue for further searching
@@ -43,7 +43,9 @@ class Enemy(pygame.sprite.Sprite):
         self.tile_x = x
         self.tile_y = y
 
-        self.render_emoji = True
+        # Emoji sprites are rendered through pygame's font module; without it
+        # (headless tests that skip pygame.init()) fall back to a plain square
+        self.render_emoji = pygame.font.get_init()
         self.emoji = emoji
 
         if self.render_emoji:
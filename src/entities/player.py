@@ -10,6 +10,8 @@ from pygame_emojis import load_emoji
 
 class Vector2:
     """Simple 2D vector class for position and velocity."""
+
+    __slots__ = ('x', 'y')
     
     def __init__(self, x, y):
         self.x = float(x)
@@ -24,6 +26,16 @@ class Vector2:
     def __rmul__(self, scalar):
         return self.__mul__(scalar)
 
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __imul__(self, scalar):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
 
 class Player(pygame.sprite.Sprite):
     """
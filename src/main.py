@@ -88,8 +88,10 @@ class BrainMaze:
         self.maze = Maze(grid_size, tile_size, min_wall_length, max_wall_length, orientation, max_attempts,
                         generator, corner_radius, self.window_width, self.window_height)
         self.collision_manager = CollisionManager(self.maze, self.config)
+        self.frame_background = self._build_frame_background()
+        self.needs_full_redraw = True
 
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.RenderUpdates()
         self.enemies = pygame.sprite.Group()
 
         start_x, start_y = self.maze.get_start_position()
@@ -102,6 +104,18 @@ class BrainMaze:
         for _ in range(self.game_state.max_enemies_at_once):
             self._spawn_enemy()
 
+    def _build_frame_background(self):
+        colors = {
+            'floor': self.floor_color,
+            'wall': self.wall_color,
+            'start': self.start_color,
+            'end': self.end_color
+        }
+        background = pygame.Surface((self.window_width, self.window_height)).convert()
+        background.fill(self.bg_color)
+        self.maze.render(background, colors)
+        return background
+
     def _create_maze_generator(self, maze_type, min_wall_length, max_wall_length, orientation):
         if maze_type == 1:
             return MazeType1(min_wall_length, max_wall_length, orientation)
@@ -207,22 +221,25 @@ class BrainMaze:
     def render(self):
         if self.level_complete_screen.is_active():
             self.level_complete_screen.render(self.screen)
-        else:
-            self.screen.fill(self.bg_color)
-
-            colors = {
-                'floor': self.floor_color,
-                'wall': self.wall_color,
-                'start': self.start_color,
-                'end': self.end_color
-            }
-            self.maze.render(self.screen, colors)
+            self.needs_full_redraw = True
+            pygame.display.flip()
+            return
 
+        overlays_active = self.effects_manager.is_active() or self.fact_display.is_active()
+        if self.needs_full_redraw or overlays_active:
+            self.screen.blit(self.frame_background, (0, 0))
             self.all_sprites.draw(self.screen)
             self.effects_manager.render(self.screen)
             self.fact_display.render(self.screen)
+            pygame.display.flip()
+            # One more full frame after the overlays finish wipes what they left
+            self.needs_full_redraw = overlays_active
+            return
 
-        pygame.display.flip()
+        # Only the sprites change over a static frame, so restore the background
+        # under their old rects and push just those rects to the display.
+        self.all_sprites.clear(self.screen, self.frame_background)
+        pygame.display.update(self.all_sprites.draw(self.screen))
 
     def run(self):
         while self.running:
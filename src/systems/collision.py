@@ -22,6 +22,7 @@ class CollisionManager:
         """
         self.maze = maze
         self.tile_size = config.getint('Maze', 'tile_size')
+        self.half_tile = self.tile_size // 2
         self.corner_forgiveness = config.getint('Player', 'corner_forgiveness')
 
     def can_move_to_tile(self, from_tile_x, from_tile_y, to_tile_x, to_tile_y):
@@ -58,8 +59,8 @@ class CollisionManager:
         tile_y = int(pixel_y // self.tile_size)
 
         # Get center of current tile
-        tile_center_x = tile_x * self.tile_size + self.tile_size // 2
-        tile_center_y = tile_y * self.tile_size + self.tile_size // 2
+        tile_center_x = tile_x * self.tile_size + self.half_tile
+        tile_center_y = tile_y * self.tile_size + self.half_tile
 
         # Calculate offset from tile center
         offset_x = pixel_x - tile_center_x
@@ -109,6 +110,6 @@ class CollisionManager:
         Returns:
             tuple: (center_x, center_y) in pixels
         """
-        center_x = tile_x * self.tile_size + self.tile_size // 2
-        center_y = tile_y * self.tile_size + self.tile_size // 2
+        center_x = tile_x * self.tile_size + self.half_tile
+        center_y = tile_y * self.tile_size + self.half_tile
         return (center_x, center_y)
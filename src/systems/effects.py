@@ -58,6 +58,9 @@ class EffectsManager:
             particle = Particle(x, y, self.glow_color, 1.0)
             self.particles.append(particle)
 
+    def is_active(self):
+        return self.flash_active or bool(self.particles)
+
     def update(self, dt):
         if self.flash_active:
             self.flash_timer -= dt
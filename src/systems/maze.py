@@ -1,16 +1,103 @@
 import random
+import multiprocessing
 import pygame
-import colorsys
 from systems.maze_type_1 import MazeType1
 from systems.maze_validator import MazeValidator
 from systems.maze_looper import loop_maze
 from systems.maze_constants import WALL, PATH
 
+# Bits of Maze._wall_mask: which of a cell's eight neighbours are walls
+WALL_N, WALL_E, WALL_S, WALL_W = 0x01, 0x02, 0x04, 0x08
+WALL_NE, WALL_NW, WALL_SE, WALL_SW = 0x10, 0x20, 0x40, 0x80
+WALL_SIDES = WALL_N | WALL_E | WALL_S | WALL_W
+
+
+def _corner_circles(is_wall, mask):
+    """(dx, dy, bright) for each corner circle a tile with this neighbour mask
+    draws, in draw order; (dx, dy) is the tile corner the circle sits on"""
+    north, east = mask & WALL_N, mask & WALL_E
+    south, west = mask & WALL_S, mask & WALL_W
+    circles = []
+    if is_wall:
+        # Bright fillets where two wall sides meet
+        if north and west:
+            circles.append((0, 0, True))
+        if north and east:
+            circles.append((1, 0, True))
+        if south and west:
+            circles.append((0, 1, True))
+        if south and east:
+            circles.append((1, 1, True))
+        # Floor-colored rounding on the outside of an L-shaped wall
+        if south and east and not north and not west:
+            circles.append((0, 0, False))
+        if south and west and not north and not east:
+            circles.append((1, 0, False))
+        if north and east and not south and not west:
+            circles.append((0, 1, False))
+        if north and west and not south and not east:
+            circles.append((1, 1, False))
+    else:
+        # Floor-colored rounding on inside corners of a path
+        if north and west and not mask & WALL_NW:
+            circles.append((0, 0, False))
+        if north and east and not mask & WALL_NE:
+            circles.append((1, 0, False))
+        if south and west and not mask & WALL_SW:
+            circles.append((0, 1, False))
+        if south and east and not mask & WALL_SE:
+            circles.append((1, 1, False))
+    return tuple(circles)
+
+
+# Corner circles per neighbour mask, looked up once per tile while drawing
+WALL_CORNER_CIRCLES = tuple(_corner_circles(True, mask) for mask in range(256))
+PATH_CORNER_CIRCLES = tuple(_corner_circles(False, mask) for mask in range(256))
+NO_CORNER_CIRCLES = ((),) * 256
+
+
+def _hsv_to_rgb(h, s, v):
+    """Same result as colorsys.hsv_to_rgb, scaled to 0-255 ints"""
+    i = int(h * 6.0)
+    f = h * 6.0 - i
+    p, q, t = v * (1.0 - s), v * (1.0 - s * f), v * (1.0 - s * (1.0 - f))
+    r, g, b = ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))[i % 6]
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+# One (bright border, dark fill) pair per 12 evenly-spaced hues, built once at import
+WALL_PALETTE = tuple(
+    (_hsv_to_rgb(i / 12.0, 0.85, 0.95), _hsv_to_rgb(i / 12.0, 0.80, 0.45))
+    for i in range(12)
+)
+
+
+def _attempt_worker(job):
+    """One generation attempt in a worker process: (grid, start, end) if valid, else None"""
+    generator, grid_size, corner_pairs, seed = job
+    random.seed(seed)
+    grid = generator.generate(grid_size)
+    start_pos, end_pos = Maze._pick_start_end(grid, grid_size, corner_pairs)
+    if not Maze._ends_open(grid, grid_size, start_pos, end_pos):
+        return None
+    connected, fully_traversable = MazeValidator(grid, grid_size).validate(start_pos, end_pos)
+    if connected and fully_traversable:
+        return grid, start_pos, end_pos
+    return None
+
 
 class Maze:
+    __slots__ = ('grid_size', 'window_width', 'window_height', 'base_tile_size', 'tile_size',
+                 'offset_x', 'offset_y', 'corner_radius', 'max_attempts', 'n_workers',
+                 '_corner_pairs', 'generator', 'grid', 'start_pos', 'end_pos',
+                 '_wall_colors', '_background', '_background_colors', '_wall_mask', '_components', '_tile_rects')
+
+    # 3x3 search pattern around a corner, in row-major order
+    _CORNER_OFFSETS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1))
+
     def __init__(self, grid_size, tile_size, min_wall_length=1, max_wall_length=5,
                  orientation='vertical', max_attempts=100, generator=None, corner_radius=4,
-                 window_width=800, window_height=880):
+                 window_width=800, window_height=880, n_workers=None):
         self.grid_size = grid_size
         self.window_width = window_width
         self.window_height = window_height
@@ -19,11 +106,20 @@ class Maze:
         self.offset_x, self.offset_y = self._calculate_offsets()
         self.corner_radius = corner_radius
         self.max_attempts = max_attempts
+        # Worker processes for generation attempts; None or 1 keeps it in-process
+        self.n_workers = n_workers
+        n = grid_size
+        self._corner_pairs = (((1, 1), (n - 2, n - 2)), ((n - 2, 1), (1, n - 2)))
         self.generator = generator or MazeType1(min_wall_length, max_wall_length, orientation)
         self.grid = []
         self.start_pos = None
         self.end_pos = None
-        self.wall_colors = self._generate_wall_colors()
+        self._wall_colors = None
+        self._background = None
+        self._background_colors = None
+        self._wall_mask = []
+        self._components = None
+        self._tile_rects = self._build_tile_rects()
         self._generate()
 
     def _calculate_tile_size(self):
@@ -31,6 +127,14 @@ class Maze:
         max_tile_height = self.window_height / self.grid_size
         return int(min(max_tile_width, max_tile_height, self.base_tile_size))
 
+    def _build_tile_rects(self):
+        # Tile rects in background-surface coordinates, which are shifted by the
+        # corner radius of padding. Shared by every redraw, so never mutate them.
+        ts = self.tile_size
+        origin = self.corner_radius
+        return [[pygame.Rect(origin + x * ts, origin + y * ts, ts, ts) for x in range(self.grid_size)]
+                for y in range(self.grid_size)]
+
     def _calculate_offsets(self):
         maze_width = self.grid_size * self.tile_size
         maze_height = self.grid_size * self.tile_size
@@ -39,55 +143,137 @@ class Maze:
         return offset_x, offset_y
 
     def _generate(self):
-        for _ in range(self.max_attempts):
-            self.grid = self.generator.generate(self.grid_size)
+        self._background = None
+        self._components = None
+        if self.n_workers and self.n_workers > 1:
+            found = self._generate_parallel()
+        else:
+            found = self._generate_serial()
+
+        if found:
+            loop_maze(self)
+        else:
+            self.grid = [bytearray([PATH]) * self.grid_size for _ in range(self.grid_size)]
             self._find_start_end_positions()
 
-            validator = MazeValidator(self.grid, self.grid_size)
-            if validator.is_connected(self.start_pos, self.end_pos) and validator.is_fully_traversable(self.start_pos):
-                loop_maze(self)
-                return
+        self._wall_mask = self._compute_wall_mask()
 
-        self.grid = [[PATH] * self.grid_size for _ in range(self.grid_size)]
-        self._find_start_end_positions()
+    def _generate_serial(self):
+        for _ in range(self.max_attempts):
+            self.grid = self.generator.generate(self.grid_size)
+            self._find_start_end_positions()
+            if not self._ends_open(self.grid, self.grid_size, self.start_pos, self.end_pos):
+                continue
+
+            connected, fully_traversable = MazeValidator(self.grid, self.grid_size).validate(
+                self.start_pos, self.end_pos)
+            if connected and fully_traversable:
+                return True
+        return False
+
+    def _generate_parallel(self):
+        # Each attempt gets its own seed from the parent RNG, so workers don't
+        # share the RNG state they inherited and repeat the same maze.
+        jobs = [(self.generator, self.grid_size, self._corner_pairs, random.getrandbits(64))
+                for _ in range(self.max_attempts)]
+        with multiprocessing.Pool(self.n_workers) as pool:
+            for result in pool.imap_unordered(_attempt_worker, jobs):
+                if result is not None:
+                    self.grid, self.start_pos, self.end_pos = result
+                    return True
+        return False
+
+    def _compute_wall_mask(self):
+        # Each row of wall flags is zipped with its neighbours' rows shifted one
+        # cell left and right, so the eight neighbour bits of a row come out of a
+        # single pass. Cells past the edge count as open.
+        n = self.grid_size
+        wall_rows = [bytes(cell == WALL for cell in row) for row in self.grid]
+        open_row = bytes(n)
+        mask = []
+        for y, row in enumerate(wall_rows):
+            above = wall_rows[y - 1] if y > 0 else open_row
+            below = wall_rows[y + 1] if y < n - 1 else open_row
+            mask.append(bytearray(
+                north | east << 1 | south << 2 | west << 3 | ne << 4 | nw << 5 | se << 6 | sw << 7
+                for north, east, south, west, ne, nw, se, sw in zip(
+                    above, row[1:] + b'\x00', below, b'\x00' + row[:-1],
+                    above[1:] + b'\x00', b'\x00' + above[:-1],
+                    below[1:] + b'\x00', b'\x00' + below[:-1])
+            ))
+        return mask
+
+    def _compute_components(self):
+        """Flat list (indexed y * n + x) labelling each path cell with its
+        4-connected region, numbered from 1; walls are 0"""
+        n = self.grid_size
+        labels = [0] * (n * n)
+        label = 0
+        for y, row in enumerate(self.grid):
+            for x, cell in enumerate(row):
+                index = y * n + x
+                if cell == WALL or labels[index]:
+                    continue
+                label += 1
+                labels[index] = label
+                stack = [index]
+                while stack:
+                    index = stack.pop()
+                    cx, cy = index % n, index // n
+                    for nx, ny in ((cx, cy - 1), (cx + 1, cy), (cx, cy + 1), (cx - 1, cy)):
+                        if 0 <= nx < n and 0 <= ny < n:
+                            neighbor = ny * n + nx
+                            if not labels[neighbor] and self.grid[ny][nx] != WALL:
+                                labels[neighbor] = label
+                                stack.append(neighbor)
+        return labels
+
+    def _is_connected(self, a, b):
+        """Whether path cells a and b share a region. Regions are labelled once
+        per generated grid, so each query after the first is two lookups."""
+        n = self.grid_size
+        (ax, ay), (bx, by) = a, b
+        if not (0 <= ax < n and 0 <= ay < n and 0 <= bx < n and 0 <= by < n):
+            return False
+        if self._components is None:
+            self._components = self._compute_components()
+        label = self._components[ay * n + ax]
+        return label != 0 and label == self._components[by * n + bx]
 
     def _find_start_end_positions(self):
-        corner_pairs = [
-            ((1, 1), (self.grid_size - 2, self.grid_size - 2)),
-            ((self.grid_size - 2, 1), (1, self.grid_size - 2))
-        ]
-        start_corner, end_corner = random.choice(corner_pairs)
-
-        self.start_pos = self._find_path_near(start_corner) or start_corner
-        self.end_pos = self._find_path_near(end_corner) or end_corner
+        self.start_pos, self.end_pos = self._pick_start_end(self.grid, self.grid_size, self._corner_pairs)
 
-    def _find_path_near(self, corner):
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                pos = (corner[0] + dx, corner[1] + dy)
-                if self._is_valid_position(pos) and not self.is_wall(*pos):
-                    return pos
+    @staticmethod
+    def _pick_start_end(grid, grid_size, corner_pairs):
+        start_corner, end_corner = random.choice(corner_pairs)
+        start_pos = Maze._find_path_near(grid, grid_size, start_corner) or start_corner
+        end_pos = Maze._find_path_near(grid, grid_size, end_corner) or end_corner
+        return start_pos, end_pos
+
+    @staticmethod
+    def _ends_open(grid, grid_size, start_pos, end_pos):
+        """Cheap pre-check before validation. A position only falls back to its
+        bare corner when the corner's whole 3x3 neighbourhood is wall, and on
+        grids of 5 or more such a corner can never reach the other one."""
+        if grid_size < 5:
+            return True
+        return grid[start_pos[1]][start_pos[0]] != WALL and grid[end_pos[1]][end_pos[0]] != WALL
+
+    @staticmethod
+    def _find_path_near(grid, grid_size, corner):
+        cx, cy = corner
+        for dx, dy in Maze._CORNER_OFFSETS:
+            x, y = cx + dx, cy + dy
+            if 0 <= x < grid_size and 0 <= y < grid_size and grid[y][x] != WALL:
+                return (x, y)
         return None
 
-    def _is_valid_position(self, pos):
-        x, y = pos
-        return 0 <= x < self.grid_size and 0 <= y < self.grid_size
-
-    def _generate_wall_colors(self):
-        """Generate one random color pair (bright border, dark fill) from 12 hues for this level"""
-        # Pick one random hue from 12 evenly-spaced hues
-        hue_index = random.randint(0, 11)
-        hue = hue_index / 12.0
-
-        # Bright border: high saturation, high value
-        bright_rgb = colorsys.hsv_to_rgb(hue, 0.85, 0.95)
-        bright_color = tuple(int(c * 255) for c in bright_rgb)
-
-        # Dark fill: high saturation, lower value
-        dark_rgb = colorsys.hsv_to_rgb(hue, 0.80, 0.45)
-        dark_color = tuple(int(c * 255) for c in dark_rgb)
-
-        return (bright_color, dark_color)
+    @property
+    def wall_colors(self):
+        """Random color pair (bright border, dark fill) from 12 hues, picked on first render"""
+        if self._wall_colors is None:
+            self._wall_colors = WALL_PALETTE[random.randint(0, 11)]
+        return self._wall_colors
 
     def get_start_position(self):
         return self.start_pos
@@ -96,96 +282,185 @@ class Maze:
         return self.end_pos
 
     def is_wall(self, x, y):
-        if not (0 <= x < self.grid_size and 0 <= y < self.grid_size):
+        n = self.grid_size
+        if not (0 <= x < n and 0 <= y < n):
             return True
         return self.grid[y][x] == WALL
 
+    def are_walls(self, xs, ys):
+        """Batched is_wall over parallel x and y sequences; returns a list of bools"""
+        n = self.grid_size
+        grid = self.grid
+        return [not (0 <= x < n and 0 <= y < n) or grid[y][x] == WALL for x, y in zip(xs, ys)]
+
     def can_move_to(self, from_x, from_y, to_x, to_y):
-        return not self.is_wall(to_x, to_y)
+        n = self.grid_size
+        return 0 <= to_x < n and 0 <= to_y < n and self.grid[to_y][to_x] != WALL
 
     def render(self, surface, colors):
+        # The wall layout is fixed once generated, so the maze is drawn a single
+        # time into an offscreen surface and each frame is one blit. It is only
+        # redrawn if a new maze is generated or the caller's colors change.
+        if self._background is None or self._background_colors != colors:
+            self._background = self._render_background(colors)
+            self._background_colors = dict(colors)
+        padding = self.corner_radius
+        surface.blit(self._background, (self.offset_x - padding, self.offset_y - padding))
+
+    def _render_background(self, colors):
+        # Corner circles can spill past the outer tiles, so pad by the radius
+        # and keep the padding transparent.
+        padding = self.corner_radius
+        size = self.grid_size * self.tile_size + 2 * padding
+        background = pygame.Surface((size, size), pygame.SRCALPHA)
+        self._draw_tiles(background, colors)
+        if pygame.display.get_surface() is not None:
+            background = background.convert_alpha()
+        return background
+
+    def _draw_tiles(self, surface, colors):
         bright_color, dark_color = self.wall_colors
-        border_width = 8
         floor_color = colors['floor']
-
+        n = self.grid_size
+        ts = self.tile_size
+        origin = self.corner_radius
+
+        # Rect fills never overlap between tiles, so the floor is filled in one
+        # call and each wall is one blit of a pre-drawn tile for its N/E/S/W
+        # neighbours. The corner circles that spill into neighbouring tiles
+        # are drawn afterwards.
+        wall_tiles = [self._make_wall_tile(sides, bright_color, dark_color) for sides in range(16)]
+        # pygame draws nothing for a radius under 1, so square corners skip the
+        # circle pass entirely
+        if self.corner_radius >= 1:
+            wall_circles, path_circles = WALL_CORNER_CIRCLES, PATH_CORNER_CIRCLES
+        else:
+            wall_circles = path_circles = NO_CORNER_CIRCLES
+        if self.corner_radius > ts:
+            self._draw_tiles_in_order(surface, wall_tiles, wall_circles, path_circles,
+                                      bright_color, floor_color)
+            return
+        surface.fill(floor_color, pygame.Rect(origin, origin, n * ts, n * ts))
+        blits = []
+        corners = []
+        add_corner = corners.append
+
+        for y in range(n):
+            row = self.grid[y]
+            row_rects = self._tile_rects[y]
+            row_masks = self._wall_mask[y]
+
+            for x in range(n):
+                mask = row_masks[x]
+                if row[x] == WALL:
+                    blits.append((wall_tiles[mask & WALL_SIDES], row_rects[x]))
+                    circles = wall_circles[mask]
+                else:
+                    circles = path_circles[mask]
+                for dx, dy, bright in circles:
+                    add_corner((bright, x + dx, y + dy, x, y))
+
+        surface.blits(blits, doreturn=False)
+        if not corners:
+            return
+        corner_surfaces = {True: self._make_corner_surface(bright_color),
+                           False: self._make_corner_surface(floor_color)}
+        for bright, gx, gy, tile_x, tile_y in corners:
+            self._draw_corner_over_fills(surface, corner_surfaces[bright], gx, gy, tile_x, tile_y)
+
+    def _draw_tiles_in_order(self, surface, wall_tiles, wall_circles, path_circles,
+                             bright_color, floor_color):
+        """Draw each tile's fill and then its corner circles, one tile at a time
+        in row-major order. Used when corner_radius is larger than a tile: the
+        circles then reach tiles beyond the four around their grid point, which
+        the quadrant crop in _draw_corner_over_fills can't account for."""
+        corner_surfaces = {True: self._make_corner_surface(bright_color),
+                           False: self._make_corner_surface(floor_color)}
+        ts = self.tile_size
+        reach = self.corner_radius + 1
+        offset = self.corner_radius - reach
         for y in range(self.grid_size):
+            row = self.grid[y]
+            row_rects = self._tile_rects[y]
+            row_masks = self._wall_mask[y]
             for x in range(self.grid_size):
-                rect = self._create_tile_rect(x, y)
-
-                if self.grid[y][x] == WALL:
-                    pygame.draw.rect(surface, dark_color, rect)
-
-                    has_wall_north = y > 0 and self.grid[y-1][x] == WALL
-                    has_wall_south = y < self.grid_size - 1 and self.grid[y+1][x] == WALL
-                    has_wall_west = x > 0 and self.grid[y][x-1] == WALL
-                    has_wall_east = x < self.grid_size - 1 and self.grid[y][x+1] == WALL
-
-                    if not has_wall_north:
-                        pygame.draw.rect(surface, bright_color,
-                                       pygame.Rect(rect.x, rect.y, rect.width, border_width))
-                    if not has_wall_south:
-                        pygame.draw.rect(surface, bright_color,
-                                       pygame.Rect(rect.x, rect.y + rect.height - border_width,
-                                                 rect.width, border_width))
-                    if not has_wall_west:
-                        pygame.draw.rect(surface, bright_color,
-                                       pygame.Rect(rect.x, rect.y, border_width, rect.height))
-                    if not has_wall_east:
-                        pygame.draw.rect(surface, bright_color,
-                                       pygame.Rect(rect.x + rect.width - border_width, rect.y,
-                                                 border_width, rect.height))
-
-                    if has_wall_north and has_wall_west:
-                        self._draw_rounded_corner(surface, bright_color, rect.x, rect.y)
-                    if has_wall_north and has_wall_east:
-                        self._draw_rounded_corner(surface, bright_color, rect.x + rect.width, rect.y)
-                    if has_wall_south and has_wall_west:
-                        self._draw_rounded_corner(surface, bright_color, rect.x, rect.y + rect.height)
-                    if has_wall_south and has_wall_east:
-                        self._draw_rounded_corner(surface, bright_color, rect.x + rect.width, rect.y + rect.height)
-
-                    if has_wall_south and has_wall_east and not has_wall_north and not has_wall_west:
-                        self._draw_rounded_corner(surface, floor_color, rect.x, rect.y)
-                    if has_wall_south and has_wall_west and not has_wall_north and not has_wall_east:
-                        self._draw_rounded_corner(surface, floor_color, rect.x + rect.width, rect.y)
-                    if has_wall_north and has_wall_east and not has_wall_south and not has_wall_west:
-                        self._draw_rounded_corner(surface, floor_color, rect.x, rect.y + rect.height)
-                    if has_wall_north and has_wall_west and not has_wall_south and not has_wall_east:
-                        self._draw_rounded_corner(surface, floor_color, rect.x + rect.width, rect.y + rect.height)
-
+                mask = row_masks[x]
+                if row[x] == WALL:
+                    surface.blit(wall_tiles[mask & WALL_SIDES], row_rects[x])
+                    circles = wall_circles[mask]
                 else:
-                    color = self._get_tile_color((x, y), colors)
-                    pygame.draw.rect(surface, color, rect)
-
-                    has_wall_north = y > 0 and self.grid[y-1][x] == WALL
-                    has_wall_south = y < self.grid_size - 1 and self.grid[y+1][x] == WALL
-                    has_wall_west = x > 0 and self.grid[y][x-1] == WALL
-                    has_wall_east = x < self.grid_size - 1 and self.grid[y][x+1] == WALL
-
-                    has_wall_nw = y > 0 and x > 0 and self.grid[y-1][x-1] == WALL
-                    has_wall_ne = y > 0 and x < self.grid_size - 1 and self.grid[y-1][x+1] == WALL
-                    has_wall_sw = y < self.grid_size - 1 and x > 0 and self.grid[y+1][x-1] == WALL
-                    has_wall_se = y < self.grid_size - 1 and x < self.grid_size - 1 and self.grid[y+1][x+1] == WALL
-
-                    if has_wall_north and has_wall_west and not has_wall_nw:
-                        self._draw_rounded_corner(surface, floor_color, rect.x, rect.y)
-                    if has_wall_north and has_wall_east and not has_wall_ne:
-                        self._draw_rounded_corner(surface, floor_color, rect.x + rect.width, rect.y)
-                    if has_wall_south and has_wall_west and not has_wall_sw:
-                        self._draw_rounded_corner(surface, floor_color, rect.x, rect.y + rect.height)
-                    if has_wall_south and has_wall_east and not has_wall_se:
-                        self._draw_rounded_corner(surface, floor_color, rect.x + rect.width, rect.y + rect.height)
-
-    def _create_tile_rect(self, x, y):
-        return pygame.Rect(self.offset_x + x * self.tile_size,
-                          self.offset_y + y * self.tile_size,
-                          self.tile_size, self.tile_size)
-
-    def _get_tile_color(self, pos, colors):
-        x, y = pos
-        if self.grid[y][x] == WALL:
-            return colors['wall']
-        return colors['floor']
-
-    def _draw_rounded_corner(self, surface, color, x, y):
-        pygame.draw.circle(surface, color, (x, y), self.corner_radius)
\ No newline at end of file
+                    surface.fill(floor_color, row_rects[x])
+                    circles = path_circles[mask]
+                for dx, dy, bright in circles:
+                    surface.blit(corner_surfaces[bright],
+                                 (offset + (x + dx) * ts, offset + (y + dy) * ts))
+
+    def _make_wall_tile(self, sides, bright_color, dark_color):
+        """Dark wall tile with a bright border on each side not in the sides mask"""
+        ts = self.tile_size
+        border_width = 8
+        tile = pygame.Surface((ts, ts))
+        tile.fill(dark_color)
+        if not sides & WALL_N:
+            tile.fill(bright_color, pygame.Rect(0, 0, ts, border_width))
+        if not sides & WALL_S:
+            tile.fill(bright_color, pygame.Rect(0, ts - border_width, ts, border_width))
+        if not sides & WALL_W:
+            tile.fill(bright_color, pygame.Rect(0, 0, border_width, ts))
+        if not sides & WALL_E:
+            tile.fill(bright_color, pygame.Rect(ts - border_width, 0, border_width, ts))
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        return tile
+
+    def _make_corner_surface(self, color):
+        """Transparent square holding one corner circle, with a pixel of slack per side"""
+        reach = self.corner_radius + 1
+        corner = pygame.Surface((2 * reach, 2 * reach), pygame.SRCALPHA)
+        pygame.draw.circle(corner, color, (reach, reach), self.corner_radius)
+        if pygame.display.get_surface() is not None:
+            corner = corner.convert_alpha()
+        return corner
+
+    def _draw_corner_over_fills(self, surface, corner, gx, gy, tile_x, tile_y):
+        """Blit the circle at grid point (gx, gy) owned by tile (tile_x, tile_y).
+
+        When tiles were drawn one by one, a tile later in row-major order painted
+        over the quadrants of earlier circles that spilled into it. Now that all
+        fills happen first, those quadrants are cropped out of the blit instead.
+
+        This assumes corner_radius <= tile_size, so a circle only reaches the four
+        tiles around its grid point; _draw_tiles falls back to
+        _draw_tiles_in_order for larger radii.
+        """
+        n = self.grid_size
+        owner = (tile_y, tile_x)
+
+        def shown(qx, qy):
+            return not (0 <= qx < n and 0 <= qy < n) or (qy, qx) <= owner
+
+        nw, ne = shown(gx - 1, gy - 1), shown(gx, gy - 1)
+        sw, se = shown(gx - 1, gy), shown(gx, gy)
+        reach = self.corner_radius + 1
+        left = self.corner_radius + gx * self.tile_size - reach
+        top = self.corner_radius + gy * self.tile_size - reach
+        if nw and ne and sw and se:
+            surface.blit(corner, (left, top))
+            return
+
+        # Areas are in corner-surface coordinates, where the circle centre is (reach, reach)
+        areas = []
+        if nw and ne:
+            areas.append(pygame.Rect(0, 0, 2 * reach, reach))
+        else:
+            if nw:
+                areas.append(pygame.Rect(0, 0, reach, reach))
+            if ne:
+                areas.append(pygame.Rect(reach, 0, reach, reach))
+        if sw:
+            areas.append(pygame.Rect(0, reach, reach, reach))
+        if se:
+            areas.append(pygame.Rect(reach, reach, reach, reach))
+
+        for area in areas:
+            surface.blit(corner, (left + area.x, top + area.y), area)
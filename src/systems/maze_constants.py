@@ -5,3 +5,7 @@ This file prevents circular imports between maze modules.
 
 WALL = 1
 PATH = 0
+
+# Orthogonal neighbour offsets (N, E, S, W), one and two cells away
+NEIGHBORS_4 = ((0, -1), (1, 0), (0, 1), (-1, 0))
+NEIGHBORS_4_STEP2 = ((0, -2), (2, 0), (0, 2), (-2, 0))
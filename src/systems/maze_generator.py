@@ -1,4 +1,14 @@
+import random
+import multiprocessing
 from abc import ABC, abstractmethod
+from systems.maze_constants import PATH
+
+
+def _generate_seeded(job):
+    """One grid from a worker process, seeded so the batch is reproducible"""
+    generator, grid_size, seed = job
+    random.seed(seed)
+    return generator.generate(grid_size)
 
 
 class MazeGenerator(ABC):
@@ -6,12 +16,44 @@ class MazeGenerator(ABC):
     def generate(self, grid_size):
         pass
 
+    def generate_batch(self, count, grid_size, n_workers=None):
+        """Generate count independent grids across a process pool, in order.
+        Seeds are drawn from the parent RNG, so seeding before the call
+        reproduces the whole batch regardless of worker count."""
+        jobs = [(self, grid_size, random.getrandbits(64)) for _ in range(count)]
+        with multiprocessing.Pool(n_workers) as pool:
+            return pool.map(_generate_seeded, jobs, chunksize=16)
+
     def _mirror(self, grid, grid_size, is_vertical):
         half_count = grid_size // 2
-        for i in range(half_count):
-            mirror_i = grid_size - 1 - i
-            for j in range(grid_size):
+        if is_vertical:
+            for row in grid:
+                row[grid_size - 1:grid_size - 1 - half_count:-1] = row[:half_count]
+        else:
+            for i in range(half_count):
+                grid[grid_size - 1 - i][:] = grid[i]
+
+    def _connect_mirror_line(self, grid, grid_size, is_vertical):
+        mirror_line = grid_size // 2
+        before, after = mirror_line - 1, mirror_line + 1
+        if before < 0 or after >= grid_size:
+            return
+
+        if is_vertical:
+            candidates = [y for y in range(1, grid_size - 1, 2)
+                          if grid[y][before] == PATH and grid[y][after] == PATH]
+        else:
+            top, bottom = grid[before], grid[after]
+            candidates = [x for x in range(1, grid_size - 1, 2)
+                          if top[x] == PATH and bottom[x] == PATH]
+        if not candidates:
+            return
+
+        # One fair coin per candidate, taken from the bits of a single draw
+        coins = random.getrandbits(len(candidates))
+        for i, line in enumerate(candidates):
+            if coins >> i & 1:
                 if is_vertical:
-                    grid[j][mirror_i] = grid[j][i]
+                    grid[line][mirror_line] = PATH
                 else:
-                    grid[mirror_i][j] = grid[i][j]
+                    grid[mirror_line][line] = PATH
@@ -1,83 +1,149 @@
-from collections import deque
-from systems.maze_constants import PATH, WALL
+from systems.maze_constants import PATH, WALL, NEIGHBORS_4
+
+# bytes.translate table: a grid cell becomes b'1' if open and b'0' if a wall
+_OPEN_DIGITS = bytes(ord('1') if cell != WALL else ord('0') for cell in range(256))
 
 
 class MazeLooper:
     def __init__(self, maze):
         self.maze = maze
+        # BFS state reused by every distance search: a flat copy of the grid
+        # with a ring of walls (1 = blocked) so neighbours need no bounds
+        # checks, a preallocated queue, and per-cell distances that are only
+        # valid where _seen matches the current search generation.
+        n = maze.grid_size
+        self._stride = n + 2
+        self._steps = (-self._stride, 1, self._stride, -1)
+        self._blocked = self._build_blocked()
+        self._seen = [0] * (self._stride * self._stride)
+        self._distance = [0] * (self._stride * self._stride)
+        self._queue = [0] * (n * n)
+        self._generation = 0
+
+    def _build_blocked(self):
+        n = self.maze.grid_size
+        stride = self._stride
+        blocked = bytearray(b'\x01') * (stride * stride)
+        for y, row in enumerate(self.maze.grid):
+            base = (y + 1) * stride + 1
+            blocked[base:base + n] = bytes(cell == WALL for cell in row)
+        return blocked
 
     def remove_dead_ends(self):
+        # Opening a wall can never create a dead end, but a carve can open the
+        # cell two steps beyond an earlier dead end in the same pass, giving it
+        # a wall to open after all. So rescan after every pass that carved, and
+        # stop once a pass carves nothing: the dead ends left then have no wall
+        # to open, and rescanning forever would never fix them. Each carving
+        # pass removes a wall, so this terminates.
         while True:
-            dead_ends = self._find_dead_ends()
-            if not dead_ends:
-                break
-
-            for dead_end in dead_ends:
+            carved = False
+            for dead_end in self._find_dead_ends():
                 best_wall = self._find_longest_cycle_wall(dead_end)
                 if best_wall:
                     wx = dead_end[0] + best_wall[0]
                     wy = dead_end[1] + best_wall[1]
                     self.maze.grid[wy][wx] = PATH
+                    self._blocked[(wy + 1) * self._stride + wx + 1] = 0
+                    carved = True
+            if not carved:
+                break
 
     def _find_dead_ends(self):
+        # Each row's open cells become one int bitmask (bit x = column x), so the
+        # four neighbour masks of a row are whole-row shifts and "exactly one
+        # open neighbour" is a handful of bitwise ops per row. Cells past the
+        # edge count as closed.
+        n = self.maze.grid_size
+        full = (1 << n) - 1
+        open_rows = [int(bytes(row).translate(_OPEN_DIGITS)[::-1] or b'0', 2) for row in self.maze.grid]
         dead_ends = []
-        for y in range(self.maze.grid_size):
-            for x in range(self.maze.grid_size):
-                if not self.maze.is_wall(x, y):
-                    open_count = sum(
-                        1 for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]
-                        if self._is_valid_grid_cell(x + dx, y + dy)
-                        and not self.maze.is_wall(x + dx, y + dy)
-                    )
-                    if open_count == 1:
-                        dead_ends.append((x, y))
+        for y, row in enumerate(open_rows):
+            up = open_rows[y - 1] if y > 0 else 0
+            down = open_rows[y + 1] if y < n - 1 else 0
+            west = (row << 1) & full
+            east = row >> 1
+            at_least_two = (up & down) | (west & east) | ((up | down) & (west | east))
+            dead = row & (up | down | west | east) & ~at_least_two
+            while dead:
+                lowest = dead & -dead
+                dead_ends.append((lowest.bit_length() - 1, y))
+                dead ^= lowest
         return dead_ends
 
     def _find_longest_cycle_wall(self, pos):
         x, y = pos
-        best_direction = None
-        max_distance = -1
+        grid = self.maze.grid
+        n = self.maze.grid_size
+        candidates = []
 
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+        for dx, dy in NEIGHBORS_4:
             wall_x = x + dx
             wall_y = y + dy
             beyond_x = wall_x + dx
             beyond_y = wall_y + dy
 
-            if (self._is_valid_grid_cell(wall_x, wall_y) and
-                    self.maze.is_wall(wall_x, wall_y) and
-                    self._is_valid_grid_cell(beyond_x, beyond_y) and
-                    not self.maze.is_wall(beyond_x, beyond_y)):
+            # The wall cell lies between pos and beyond, so it is in bounds too
+            if (0 <= beyond_x < n and 0 <= beyond_y < n and
+                    grid[wall_y][wall_x] == WALL and
+                    grid[beyond_y][beyond_x] != WALL):
+                candidates.append(((dx, dy), beyond_x, beyond_y))
 
-                distance = self._path_distance(pos, (beyond_x, beyond_y))
-                if distance > max_distance:
-                    max_distance = distance
-                    best_direction = (dx, dy)
+        if not candidates:
+            return None
 
-        return best_direction
-
-    def _path_distance(self, start, end):
-        queue = deque([(start, 0)])
-        visited = {start}
-
-        while queue:
-            (x, y), dist = queue.popleft()
-            if (x, y) == end:
-                return dist
+        # One BFS from the dead end serves every candidate, and it stops as soon
+        # as all of them have a distance
+        self._search_from(pos, [(beyond_x, beyond_y) for _, beyond_x, beyond_y in candidates])
 
-            for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
-                nx = x + dx
-                ny = y + dy
-                if (self._is_valid_grid_cell(nx, ny) and
-                        not self.maze.is_wall(nx, ny) and
-                        (nx, ny) not in visited):
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), dist + 1))
+        best_direction = None
+        max_distance = -1
+        for direction, beyond_x, beyond_y in candidates:
+            distance = self._distance_to(beyond_x, beyond_y)
+            if distance > max_distance:
+                max_distance = distance
+                best_direction = direction
 
-        return -1
+        return best_direction
 
-    def _is_valid_grid_cell(self, x, y):
-        return 0 <= x < self.maze.grid_size and 0 <= y < self.maze.grid_size
+    def _search_from(self, start, targets):
+        self._generation += 1
+        generation = self._generation
+        blocked = self._blocked
+        seen = self._seen
+        distance = self._distance
+        queue = self._queue
+        steps = self._steps
+        stride = self._stride
+
+        pending = {(ty + 1) * stride + tx + 1 for tx, ty in targets}
+        x, y = start
+        origin = (y + 1) * stride + x + 1
+        seen[origin] = generation
+        distance[origin] = 0
+        pending.discard(origin)
+        queue[0] = origin
+        head, tail = 0, 1
+
+        while head < tail and pending:
+            index = queue[head]
+            head += 1
+            dist = distance[index] + 1
+            for step in steps:
+                neighbor = index + step
+                if not blocked[neighbor] and seen[neighbor] != generation:
+                    seen[neighbor] = generation
+                    distance[neighbor] = dist
+                    queue[tail] = neighbor
+                    tail += 1
+                    pending.discard(neighbor)
+
+    def _distance_to(self, x, y):
+        """Path distance from the last _search_from start, or -1 if unreachable"""
+        index = (y + 1) * self._stride + x + 1
+        if self._seen[index] != self._generation:
+            return -1
+        return self._distance[index]
 
 
 def loop_maze(maze):
@@ -12,40 +12,46 @@ class MazeType1(MazeGenerator):
         self.orientation = orientation
 
     def generate(self, grid_size):
-        grid = [[PATH] * grid_size for _ in range(grid_size)]
+        grid = [bytearray([PATH]) * grid_size for _ in range(grid_size)]
         self._scatter_walls(grid, grid_size)
         return grid
 
     def _scatter_walls(self, grid, grid_size):
         is_vertical = self.orientation == 'vertical'
         half_size = grid_size // 2 + 1
+        lines = range(1, half_size, 2)
 
-        for line in range(1, half_size, 2):
-            self._fill_line(grid, grid_size, line, is_vertical)
+        # Every line's opening coin flip and wall lengths are drawn up front in
+        # two RNG calls rather than one call per segment. A line takes at most
+        # one wall length per (wall + 1-cell path) step it advances.
+        start_flags = random.choices((True, False), k=len(lines))
+        segments_per_line = grid_size // (self.min_wall_length + 1) + 1
+        wall_lengths = iter(random.choices(range(self.min_wall_length, self.max_wall_length + 1),
+                                           k=len(lines) * segments_per_line))
+
+        for line, start_with_path in zip(lines, start_flags):
+            self._fill_line(grid, grid_size, line, is_vertical, start_with_path, wall_lengths)
 
         self._mirror(grid, grid_size, is_vertical)
 
-    def _fill_line(self, grid, grid_size, line, is_vertical):
+    def _fill_line(self, grid, grid_size, line, is_vertical, start_with_path, wall_lengths):
         position = 0
-        start_with_path = random.choice([True, False])
 
         while position < grid_size:
             if start_with_path:
                 position = self._place_segment(grid, grid_size, line, position, PATH, 1, is_vertical)
                 position = self._place_segment(grid, grid_size, line, position, WALL,
-                                              self._random_wall_length(), is_vertical)
+                                              next(wall_lengths), is_vertical)
             else:
                 position = self._place_segment(grid, grid_size, line, position, WALL,
-                                              self._random_wall_length(), is_vertical)
+                                              next(wall_lengths), is_vertical)
                 position = self._place_segment(grid, grid_size, line, position, PATH, 1, is_vertical)
 
     def _place_segment(self, grid, grid_size, line, start, cell_type, length, is_vertical):
-        for i in range(length):
-            if start + i >= grid_size:
-                break
-            x, y = (line, start + i) if is_vertical else (start + i, line)
-            grid[y][x] = cell_type
+        end = min(start + length, grid_size)
+        if is_vertical:
+            for y in range(start, end):
+                grid[y][line] = cell_type
+        else:
+            grid[line][start:end] = bytes([cell_type]) * (end - start)
         return start + length
-
-    def _random_wall_length(self):
-        return random.randint(self.min_wall_length, self.max_wall_length)
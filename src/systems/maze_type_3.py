@@ -1,19 +1,34 @@
 import random
+from itertools import permutations
 from systems.maze_generator import MazeGenerator
+from systems.maze_constants import NEIGHBORS_4_STEP2
 
 WALL = 1
 PATH = 0
 
+# All 24 orderings of the four carve directions; picking one at random is
+# a uniform shuffle without building and shuffling a fresh list per cell
+DIRECTION_ORDERS = tuple(permutations(NEIGHBORS_4_STEP2))
+
 
 class MazeType3(MazeGenerator):
     def __init__(self, orientation='vertical'):
         self.orientation = orientation
+        # Visited marks, reused across generate() calls of the same size: a
+        # cell counts as visited only where it holds the current generation,
+        # so the buffer is only cleared when the one-byte counter wraps
+        self.visited = bytearray()
+        self._generation = 0
 
     def generate(self, grid_size):
-        grid = [[WALL] * grid_size for _ in range(grid_size)]
+        grid = [bytearray([WALL]) * grid_size for _ in range(grid_size)]
         is_vertical = self.orientation == 'vertical'
         half_size = grid_size // 2 + 1
-        self.visited = [[False] * grid_size for _ in range(grid_size)]
+        # One byte per cell, indexed y * grid_size + x
+        self._generation += 1
+        if len(self.visited) != grid_size * grid_size or self._generation > 255:
+            self.visited = bytearray(grid_size * grid_size)
+            self._generation = 1
 
         if is_vertical:
             start_x = random.randrange(1, half_size, 2)
@@ -22,61 +37,43 @@ class MazeType3(MazeGenerator):
             start_x = random.randrange(1, grid_size, 2)
             start_y = random.randrange(1, half_size, 2)
 
-        self._recursive_backtrack(grid, start_x, start_y, grid_size, half_size, is_vertical)
+        self._backtrack(grid, start_x, start_y, grid_size, half_size, is_vertical)
         self._mirror(grid, grid_size, is_vertical)
-        self._connect_mirror_line(grid, grid_size, half_size, is_vertical)
+        self._connect_mirror_line(grid, grid_size, is_vertical)
         return grid
 
-    def _recursive_backtrack(self, grid, x, y, grid_size, half_size, is_vertical):
-        self.visited[y][x] = True
+    def _backtrack(self, grid, x, y, grid_size, half_size, is_vertical):
+        """Randomized depth-first carve from (x, y), run on an explicit stack of
+        (x, y, remaining directions) so large grids can't hit the recursion limit"""
+        visited = self.visited
+        generation = self._generation
+        choice = random.choice
+        # The half being generated bounds one axis, the grid bounds the other
+        x_limit = half_size if is_vertical else grid_size
+        y_limit = grid_size if is_vertical else half_size
+        visited[y * grid_size + x] = generation
         grid[y][x] = PATH
 
-        directions = [(0, -2), (2, 0), (0, 2), (-2, 0)]
-        random.shuffle(directions)
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-
-            if not self._is_valid_neighbor(nx, ny, grid_size, half_size, is_vertical):
-                continue
-
-            if self.visited[ny][nx]:
-                continue
-
-            wall_x, wall_y = x + dx // 2, y + dy // 2
-            grid[wall_y][wall_x] = PATH
-            self._recursive_backtrack(grid, nx, ny, grid_size, half_size, is_vertical)
-
-    def _is_valid_neighbor(self, x, y, grid_size, half_size, is_vertical):
-        if not (0 <= x < grid_size and 0 <= y < grid_size):
-            return False
-
-        if x % 2 == 0 or y % 2 == 0:
-            return False
-
-        if is_vertical:
-            return x < half_size
-        else:
-            return y < half_size
-
-    def _connect_mirror_line(self, grid, grid_size, half_size, is_vertical):
-        mirror_line = grid_size // 2
-
-        if is_vertical:
-            for y in range(1, grid_size - 1, 2):
-                left_x = mirror_line - 1
-                right_x = mirror_line + 1
-
-                if (0 <= left_x < grid_size and 0 <= right_x < grid_size and
-                    grid[y][left_x] == PATH and grid[y][right_x] == PATH):
-                    if random.random() < 0.5:
-                        grid[y][mirror_line] = PATH
-        else:
-            for x in range(1, grid_size - 1, 2):
-                top_y = mirror_line - 1
-                bottom_y = mirror_line + 1
-
-                if (0 <= top_y < grid_size and 0 <= bottom_y < grid_size and
-                    grid[top_y][x] == PATH and grid[bottom_y][x] == PATH):
-                    if random.random() < 0.5:
-                        grid[mirror_line][x] = PATH
+        stack = [(x, y, iter(choice(DIRECTION_ORDERS)))]
+
+        while stack:
+            x, y, pending = stack[-1]
+            for dx, dy in pending:
+                nx, ny = x + dx, y + dy
+
+                # Neighbour checks inlined: inside the generated half and not
+                # yet visited. The start is odd and every step is two cells, so
+                # neighbours are always on odd cells.
+                if not (0 <= nx < x_limit and 0 <= ny < y_limit):
+                    continue
+                if visited[ny * grid_size + nx] == generation:
+                    continue
+
+                grid[y + dy // 2][x + dx // 2] = PATH
+                visited[ny * grid_size + nx] = generation
+                grid[ny][nx] = PATH
+
+                stack.append((nx, ny, iter(choice(DIRECTION_ORDERS))))
+                break
+            else:
+                stack.pop()
@@ -8,24 +8,90 @@ class MazeValidator:
     def __init__(self, grid, grid_size):
         self.grid = grid
         self.grid_size = grid_size
+        # Counted on first use and kept, since the grid doesn't change while
+        # it is being validated
+        self._total_paths = None
+
+    def validate(self, start, end):
+        """Run one BFS from start and return (is_connected, is_fully_traversable)"""
+        if not start:
+            return False, False
+
+        total_paths = self._count_paths()
+
+        cells, stride = self._padded_cells()
+        start_index = self._padded_index(start, stride)
+        end_index = self._padded_index(end, stride)
+        if start_index is None:
+            # Nothing is reachable from beyond the wall ring; the start alone
+            # counts as visited
+            return start == end or self._adjacent(start, end), total_paths == 1
+        # An end beyond the ring can only ever be next to the start itself
+        connected = start == end or (end_index is None and self._adjacent(start, end))
+        # A wall start still counts as visited, so only an open start can stop
+        # early: once every path cell is reached nothing else can be visited.
+        start_open = not cells[start_index]
+        cells[start_index] = 1
+        remaining = total_paths - 1
+        queue = deque([start_index])
+
+        while queue:
+            index = queue.popleft()
+            for step in (-stride, 1, stride, -1):
+                neighbor = index + step
+                if neighbor == end_index:
+                    connected = True
+                if not cells[neighbor]:
+                    cells[neighbor] = 1
+                    remaining -= 1
+                    if not remaining and connected and start_open:
+                        return True, True
+                    queue.append(neighbor)
+
+        return connected, remaining == 0
 
     def is_connected(self, start, end):
+        """Bidirectional BFS: grow whichever frontier is smaller by one level
+        at a time, and stop as soon as either search reaches a cell the other
+        has marked"""
         if start == end:
             return True
 
-        visited = {start}
-        queue = deque([start])
+        cells, stride = self._padded_cells()
+        start_index = self._padded_index(start, stride)
+        end_index = self._padded_index(end, stride)
+        if start_index is None or end_index is None:
+            # Only cells inside the grid are searched, and their neighbours stay
+            # within the wall ring, so a position beyond it connects to nothing
+            # but a direct neighbour
+            return self._adjacent(start, end)
+        # Walls are 1, so the two searches mark their cells 2 and 3
+        cells[start_index] = 2
+        cells[end_index] = 3
+        forward, backward = [start_index], [end_index]
+        steps = (-stride, 1, stride, -1)
 
-        while queue:
-            x, y = queue.popleft()
+        while forward and backward:
+            if len(forward) <= len(backward):
+                frontier, mark, other = forward, 2, 3
+            else:
+                frontier, mark, other = backward, 3, 2
 
-            for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if (nx, ny) == end:
-                    return True
-                if self._is_valid_path(nx, ny) and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
+            next_frontier = []
+            for index in frontier:
+                for step in steps:
+                    neighbor = index + step
+                    cell = cells[neighbor]
+                    if cell == other:
+                        return True
+                    if not cell:
+                        cells[neighbor] = mark
+                        next_frontier.append(neighbor)
+
+            if mark == 2:
+                forward = next_frontier
+            else:
+                backward = next_frontier
 
         return False
 
@@ -33,22 +99,60 @@ class MazeValidator:
         if not start_pos:
             return False
 
-        total_paths = sum(1 for row in self.grid for cell in row if cell == PATH)
+        total_paths = self._count_paths()
 
-        visited = {start_pos}
-        queue = deque([start_pos])
+        cells, stride = self._padded_cells()
+        start_index = self._padded_index(start_pos, stride)
+        if start_index is None:
+            # Nothing is reachable from beyond the wall ring; the start alone
+            # counts as visited
+            return total_paths == 1
+        start_open = not cells[start_index]
+        cells[start_index] = 1
+        remaining = total_paths - 1
+        queue = deque([start_index])
 
         while queue:
-            x, y = queue.popleft()
-            for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if self._is_valid_path(nx, ny) and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
-
-        return len(visited) == total_paths
-
-    def _is_valid_path(self, x, y):
-        return (0 <= x < self.grid_size and
-                0 <= y < self.grid_size and
-                self.grid[y][x] != WALL)
+            index = queue.popleft()
+            for step in (-stride, 1, stride, -1):
+                neighbor = index + step
+                if not cells[neighbor]:
+                    cells[neighbor] = 1
+                    remaining -= 1
+                    if not remaining and start_open:
+                        return True
+                    queue.append(neighbor)
+
+        return remaining == 0
+
+    def _count_paths(self):
+        # row.count runs in C for both bytearray and list rows
+        if self._total_paths is None:
+            self._total_paths = sum(row.count(PATH) for row in self.grid)
+        return self._total_paths
+
+    @staticmethod
+    def _adjacent(a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+
+    def _padded_cells(self):
+        """Flat copy of the grid with 1 for blocked cells, surrounded by two rings
+        of walls so neighbour lookups need no bounds checks. Positions in the
+        inner ring (just outside the grid) can be searched from; the outer ring
+        keeps their neighbours inside the buffer. The BFS marks visited cells as
+        blocked in the same buffer."""
+        n = self.grid_size
+        stride = n + 4
+        cells = bytearray(b'\x01') * (stride * stride)
+        for y, row in enumerate(self.grid):
+            base = (y + 2) * stride + 2
+            cells[base:base + n] = bytes(cell == WALL for cell in row)
+        return cells, stride
+
+    def _padded_index(self, pos, stride):
+        """Index of pos in the padded buffer, or None when pos lies beyond the
+        inner wall ring around the grid. Callers check for None before indexing."""
+        x, y = pos
+        if not (-1 <= x <= self.grid_size and -1 <= y <= self.grid_size):
+            return None
+        return (y + 2) * stride + x + 2
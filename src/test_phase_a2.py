@@ -35,8 +35,8 @@ def test_maze_generation():
     print(f"  ✓ End position: {maze.end_pos}")
 
     # Check that we have both walls and paths
-    wall_count = sum(1 for row in maze.grid for cell in row if cell == WALL)
-    path_count = sum(1 for row in maze.grid for cell in row if cell == PATH)
+    wall_count = sum(row.count(WALL) for row in maze.grid)
+    path_count = sum(row.count(PATH) for row in maze.grid)
 
     assert wall_count > 0, "Maze should have walls"
     assert path_count > 0, "Maze should have paths"
@@ -14,9 +14,13 @@ class FactDisplay:
         self.background_color = (30, 30, 40)
         self.text_color = (200, 200, 200)
         self.padding = 10
+        self._line_surfaces = []
 
     def show(self, fact: str):
         self.current_fact = fact
+        # Wrap and rasterize once per fact; render() only blits
+        self._line_surfaces = [self.font.render(line, True, self.text_color)
+                               for line in self._wrap_text(fact)]
         self.active = True
         self.elapsed_time = 0.0
 
@@ -36,13 +40,11 @@ class FactDisplay:
         pygame.draw.rect(screen, self.background_color, panel_rect)
 
         if self.active:
-            lines = self._wrap_text(self.current_fact)
             line_height = self.font.get_height()
-            total_text_height = len(lines) * line_height
+            total_text_height = len(self._line_surfaces) * line_height
             y_offset = display_y + (self.reserved_height - total_text_height) // 2
 
-            for line in lines:
-                text_surface = self.font.render(line, True, self.text_color)
+            for text_surface in self._line_surfaces:
                 text_rect = text_surface.get_rect(center=(self.screen_width // 2, y_offset))
                 screen.blit(text_surface, text_rect)
                 y_offset += line_height
@@ -54,20 +56,29 @@ class FactDisplay:
         max_width = self.screen_width - (self.padding * 2)
         words = text.split()
         lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font.render(test_line, True, self.text_color)
-
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        start = 0
+
+        while start < len(words):
+            # Find the most words that fit on this line by doubling, then
+            # bisecting; a line always takes at least one word
+            remaining = len(words) - start
+            fit, miss = 1, 2
+            while miss <= remaining and self._text_width(words[start:start + miss]) <= max_width:
+                fit, miss = miss, miss * 2
+            miss = min(miss, remaining + 1)
+
+            while miss - fit > 1:
+                middle = (fit + miss) // 2
+                if self._text_width(words[start:start + middle]) <= max_width:
+                    fit = middle
+                else:
+                    miss = middle
+
+            lines.append(' '.join(words[start:start + fit]))
+            start += fit
 
         return lines
+
+    def _text_width(self, words: list) -> int:
+        # Font.size measures without rasterizing a surface
+        return self.font.size(' '.join(words))[0]
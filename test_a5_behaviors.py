@@ -4,36 +4,62 @@ Verifies all behaviors can be instantiated and respond correctly.
 """
 
 import sys
+from functools import lru_cache
 sys.path.insert(0, 'src')
 
 from ai.behaviors import WandererBehavior, PatrolBehavior
 
 
+MOCK_CONFIG_VALUES = {
+    ('Movement', 'wander_direction_change_interval'): '2.0',
+    ('Behaviors', 'behavior_types'): 'wanderer,seeker,patrol,flee,combo',
+    ('Behaviors', 'seeker_aggression_threshold'): '0.5',
+    ('Behaviors', 'flee_trigger_distance'): '5',
+}
+
+
+# The mock values never change, so each lookup and conversion is done once
+@lru_cache(maxsize=None)
+def _config_value(section, key):
+    return MOCK_CONFIG_VALUES.get((section, key), '0')
+
+
+@lru_cache(maxsize=None)
+def _config_float(section, key):
+    return float(_config_value(section, key))
+
+
+@lru_cache(maxsize=None)
+def _config_int(section, key):
+    return int(_config_float(section, key))
+
+
+DIRECTION_DELTAS = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+
+
 class MockConfig:
     def get(self, section, key):
-        configs = {
-            ('Movement', 'wander_direction_change_interval'): '2.0',
-            ('Behaviors', 'behavior_types'): 'wanderer,seeker,patrol,flee,combo',
-            ('Behaviors', 'seeker_aggression_threshold'): '0.5',
-            ('Behaviors', 'flee_trigger_distance'): '5',
-        }
-        return configs.get((section, key), '0')
+        return _config_value(section, key)
 
     def getfloat(self, section, key):
-        return float(self.get(section, key))
+        return _config_float(section, key)
 
     def getint(self, section, key):
-        return int(float(self.get(section, key)))
+        return _config_int(section, key)
 
 
 class MockMaze:
     def __init__(self):
         self.grid_size = 20
+        # Wall flags built once: a single wall down column 10 over the top half
+        self.walls = [[x == 10 and y < 10 for x in range(self.grid_size)]
+                      for y in range(self.grid_size)]
 
     def is_wall(self, x, y):
-        if x < 0 or x >= self.grid_size or y < 0 or y >= self.grid_size:
+        n = self.grid_size
+        if not (0 <= x < n and 0 <= y < n):
             return True
-        return (x == 10 and y < 10)
+        return self.walls[y][x]
 
 
 class MockCollisionManager:
@@ -54,20 +80,10 @@ class MockEnemy:
         self.behavior_type_override = None
 
     def can_move_in_direction(self, direction):
-        target_x, target_y = self.tile_x, self.tile_y
-
-        if direction == 'up':
-            target_y -= 1
-        elif direction == 'down':
-            target_y += 1
-        elif direction == 'left':
-            target_x -= 1
-        elif direction == 'right':
-            target_x += 1
-
+        dx, dy = DIRECTION_DELTAS.get(direction, (0, 0))
         return self.collision_manager.can_move_to_tile(
             self.tile_x, self.tile_y,
-            target_x, target_y
+            self.tile_x + dx, self.tile_y + dy
         )
 
 
@@ -1,4 +1,7 @@
+import io
 import sys
+import multiprocessing
+from contextlib import redirect_stdout
 sys.path.insert(0, 'src')
 
 from systems.maze import Maze
@@ -14,15 +17,17 @@ def analyze_maze(maze, maze_name):
     print(f"Testing {maze_name}")
     print(f"{'='*60}")
 
-    # Count walls and paths
+    # One pass over the rows counts walls and checks vertical mirroring
+    # (each row's left half against its right half read backwards)
+    n = maze.grid_size
+    half = n // 2
     walls = 0
-    paths = 0
+    is_mirrored = True
     for row in maze.grid:
-        for cell in row:
-            if cell == 1:
-                walls += 1
-            else:
-                paths += 1
+        walls += row.count(1)
+        if is_mirrored and row[:half] != row[n - 1:n - 1 - half:-1]:
+            is_mirrored = False
+    paths = n * n - walls
 
     print(f"Grid size: {maze.grid_size}x{maze.grid_size}")
     print(f"Total cells: {maze.grid_size * maze.grid_size}")
@@ -31,9 +36,6 @@ def analyze_maze(maze, maze_name):
     print(f"Start position: {maze.start_pos}")
     print(f"End position: {maze.end_pos}")
 
-    # Check mirroring
-    is_vertical = True
-    is_mirrored = check_mirroring(maze.grid, maze.grid_size, is_vertical)
     print(f"Vertical mirroring: {'✓' if is_mirrored else '✗'}")
 
     # Visualize small portion
@@ -43,27 +45,11 @@ def analyze_maze(maze, maze_name):
     return walls, paths
 
 
-def check_mirroring(grid, grid_size, is_vertical):
-    """Check if grid is mirrored."""
-    for i in range(grid_size // 2):
-        mirror_i = grid_size - 1 - i
-        for j in range(grid_size):
-            if is_vertical:
-                if grid[j][i] != grid[j][mirror_i]:
-                    return False
-            else:
-                if grid[i][j] != grid[mirror_i][j]:
-                    return False
-    return True
-
-
 def visualize_corner(grid, size):
     """Print a small corner of the maze."""
-    for y in range(min(size, len(grid))):
-        row = ""
-        for x in range(min(size, len(grid[0]))):
-            row += "█" if grid[y][x] == 1 else " "
-        print(row)
+    width = min(size, len(grid[0])) if grid else 0
+    print('\n'.join(''.join("█" if cell == 1 else " " for cell in row[:width])
+                    for row in grid[:size]))
 
 
 def test_maze_type(maze_type_class, name, *args):
@@ -85,31 +71,36 @@ def test_maze_type(maze_type_class, name, *args):
         return None
 
 
+def _run_case(case):
+    """Run one maze-type test in a worker and capture what it prints."""
+    maze_type_class, name, args = case
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = test_maze_type(maze_type_class, name, *args)
+    return output.getvalue(), result
+
+
 def main():
     print("Testing All Maze Generation Algorithms")
     print("=" * 60)
 
-    results = []
+    cases = [
+        (MazeType1, "Type 1: Scattered Walls", (1, 5, 'vertical')),
+        (MazeType2, "Type 2: Binary Tree", (0.5, 'vertical')),
+        (MazeType3, "Type 3: Recursive Backtracking", ('vertical',)),
+        (MazeType4, "Type 4: Sidewinder", ('vertical',)),
+    ]
+
+    # The generators are independent, so test them in parallel and print each
+    # captured report in order afterwards
+    with multiprocessing.Pool(len(cases)) as pool:
+        outcomes = pool.map(_run_case, cases)
 
-    # Test Type 1: Scattered walls
-    result = test_maze_type(MazeType1, "Type 1: Scattered Walls", 1, 5, 'vertical')
-    if result:
-        results.append(("Type 1", result))
-
-    # Test Type 2: Binary tree
-    result = test_maze_type(MazeType2, "Type 2: Binary Tree", 0.5, 'vertical')
-    if result:
-        results.append(("Type 2", result))
-
-    # Test Type 3: Recursive backtracking
-    result = test_maze_type(MazeType3, "Type 3: Recursive Backtracking", 'vertical')
-    if result:
-        results.append(("Type 3", result))
-
-    # Test Type 4: Sidewinder
-    result = test_maze_type(MazeType4, "Type 4: Sidewinder", 'vertical')
-    if result:
-        results.append(("Type 4", result))
+    results = []
+    for (_, name, _), (output, result) in zip(cases, outcomes):
+        print(output, end='')
+        if result:
+            results.append((name.split(':')[0], result))
 
     # Summary
     print(f"\n{'='*60}")
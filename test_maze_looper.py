@@ -4,21 +4,22 @@ sys.path.insert(0, 'src')
 from systems.maze import Maze
 from systems.maze_type_2 import MazeType2
 from systems.maze_looper import loop_maze
+from systems.maze_constants import WALL
 
 
 def count_dead_ends(maze):
+    # Zip each row of open flags with the rows above and below and with
+    # itself shifted left and right, so every cell sees its four neighbours
+    # in one pass; out of bounds counts as wall
+    n = maze.grid_size
+    open_rows = [[cell != WALL for cell in row] for row in maze.grid]
+    closed = [False] * n
     dead_ends = 0
-    for y in range(maze.grid_size):
-        for x in range(maze.grid_size):
-            if not maze.is_wall(x, y):
-                open_count = sum(
-                    1 for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]
-                    if 0 <= x + dx < maze.grid_size
-                    and 0 <= y + dy < maze.grid_size
-                    and not maze.is_wall(x + dx, y + dy)
-                )
-                if open_count == 1:
-                    dead_ends += 1
+    for above, row, below in zip([closed] + open_rows[:-1], open_rows, open_rows[1:] + [closed]):
+        left = [False] + row[:-1]
+        right = row[1:] + [False]
+        dead_ends += sum(1 for cell, up, down, west, east in zip(row, above, below, left, right)
+                         if cell and up + down + west + east == 1)
     return dead_ends
 
 
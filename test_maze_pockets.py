@@ -4,70 +4,89 @@ Check if all path cells are reachable from start position.
 """
 
 import sys
+import random
+from concurrent.futures import ProcessPoolExecutor
 sys.path.insert(0, 'src')
 
 from systems.maze import Maze
+from systems.maze_constants import WALL, NEIGHBORS_4
+from systems.maze_type_1 import MazeType1
 from collections import deque
 
-def count_reachable_cells(maze):
-    """
-    Count how many path cells are reachable from start using BFS.
+# One generator shared by every maze this process builds; only generate()
+# varies between mazes
+GENERATOR = MazeType1(min_wall_length=1, max_wall_length=4)
 
-    Returns:
-        tuple: (reachable_count, total_path_count, has_pockets)
-    """
-    start_x, start_y = maze.start_pos
+def count_path_cells(maze):
+    """Count open cells; row.count does the per-cell work in C."""
+    return maze.grid_size * maze.grid_size - sum(row.count(WALL) for row in maze.grid)
 
-    # BFS from start
+def find_reachable_cells(maze):
+    """BFS from start straight over the grid rows. Returns a flat bytearray
+    indexed y * grid_size + x, holding 1 for every reachable cell."""
+    grid = maze.grid
+    n = maze.grid_size
+    start_x, start_y = maze.start_pos
+    reachable = bytearray(n * n)
+    reachable[start_y * n + start_x] = 1
     queue = deque([maze.start_pos])
-    visited = set([maze.start_pos])
 
     while queue:
         x, y = queue.popleft()
-
-        # Check all 4 neighbors
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+        for dx, dy in NEIGHBORS_4:
             nx, ny = x + dx, y + dy
-
-            # Check if valid and unvisited path
-            if (0 <= nx < maze.grid_size and
-                0 <= ny < maze.grid_size and
-                not maze.is_wall(nx, ny) and
-                (nx, ny) not in visited):
-                visited.add((nx, ny))
+            if 0 <= nx < n and 0 <= ny < n and not reachable[ny * n + nx] and grid[ny][nx] != WALL:
+                reachable[ny * n + nx] = 1
                 queue.append((nx, ny))
 
+    return reachable
+
+def count_reachable_cells(maze, visited=None):
+    """
+    Count how many path cells are reachable from start using BFS.
+    Pass visited to reuse reachable cells that were already found.
+
+    Returns:
+        tuple: (reachable_count, total_path_count, has_pockets)
+    """
+    if visited is None:
+        visited = find_reachable_cells(maze)
+
     # Count total path cells
-    total_paths = 0
-    for y in range(maze.grid_size):
-        for x in range(maze.grid_size):
-            if not maze.is_wall(x, y):
-                total_paths += 1
+    total_paths = count_path_cells(maze)
 
-    reachable = len(visited)
+    reachable = visited.count(1)
     has_pockets = reachable < total_paths
 
     return reachable, total_paths, has_pockets
 
+def _generate_and_check(seed):
+    """Build one seeded maze and find its reachable cells (runs in a worker)."""
+    random.seed(seed)
+    maze = Maze(
+        grid_size=20,
+        tile_size=40,
+        generator=GENERATOR,
+        max_attempts=100
+    )
+    return maze, find_reachable_cells(maze)
+
 def test_multiple_mazes():
-    """Test multiple maze generations for pockets."""
+    """Test multiple maze generations for pockets.
+    Returns (all_connected, [(maze, reachable_cells), ...])."""
     print("Testing 10 mazes for isolated pockets...")
     print()
 
     pocket_count = 0
     total_mazes = 10
 
-    for i in range(total_mazes):
-        maze = Maze(
-            grid_size=20,
-            tile_size=40,
-            wall_density=0.2,
-            max_wall_length=4,
-            max_attempts=100
-        )
-
-        reachable, total_paths, has_pockets = count_reachable_cells(maze)
+    # Mazes are independent, so build and check them across processes;
+    # map keeps the results in maze order for printing
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_generate_and_check, range(total_mazes)))
 
+    for i, (maze, reachable_cells) in enumerate(results):
+        reachable, total_paths, has_pockets = count_reachable_cells(maze, reachable_cells)
         if has_pockets:
             pocket_count += 1
             unreachable = total_paths - reachable
@@ -87,58 +106,29 @@ def test_multiple_mazes():
         print()
         print("✓ All mazes are fully traversable with no isolated pockets!")
 
-    return pocket_count == 0
+    return pocket_count == 0, results
 
-def visualize_reachability():
+def visualize_reachability(maze, reachable):
     """Visualize a maze showing reachable vs unreachable areas."""
     print()
     print("Visualizing maze reachability:")
     print()
 
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
-
-    # Get reachable cells
-    start_x, start_y = maze.start_pos
-    queue = deque([maze.start_pos])
-    reachable = set([maze.start_pos])
-
-    while queue:
-        x, y = queue.popleft()
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < maze.grid_size and
-                0 <= ny < maze.grid_size and
-                not maze.is_wall(nx, ny) and
-                (nx, ny) not in reachable):
-                reachable.add((nx, ny))
-                queue.append((nx, ny))
-
-    # Print maze with reachability
-    for y in range(maze.grid_size):
-        for x in range(maze.grid_size):
-            if (x, y) == maze.start_pos:
-                print('S', end='')  # Start
-            elif (x, y) == maze.end_pos:
-                print('E', end='')  # End
-            elif maze.is_wall(x, y):
-                print('█', end='')  # Wall
-            elif (x, y) in reachable:
-                print('·', end='')  # Reachable path
-            else:
-                print('X', end='')  # UNREACHABLE pocket!
-        print()
+    # Print maze with reachability: walls, reachable paths and UNREACHABLE
+    # pockets per cell, then start and end marked over them
+    n = maze.grid_size
+    rows = [['█' if cell == WALL else '·' if reachable[y * n + x] else 'X'
+             for x, cell in enumerate(row)]
+            for y, row in enumerate(maze.grid)]
+    for (x, y), mark in ((maze.start_pos, 'S'), (maze.end_pos, 'E')):
+        rows[y][x] = mark
+    print('\n'.join(''.join(row) for row in rows))
 
     print()
     print("Legend: S=Start, E=End, █=Wall, ·=Reachable, X=UNREACHABLE POCKET")
 
-    total_paths = sum(1 for y in range(maze.grid_size) for x in range(maze.grid_size) if not maze.is_wall(x, y))
-    unreachable = total_paths - len(reachable)
+    total_paths = count_path_cells(maze)
+    unreachable = total_paths - reachable.count(1)
 
     if unreachable > 0:
         print(f"⚠️  Found {unreachable} unreachable cells!")
@@ -152,8 +142,11 @@ if __name__ == '__main__':
     print("=" * 60)
     print()
 
-    all_connected = test_multiple_mazes()
-    visualize_reachability()
+    all_connected, results = test_multiple_mazes()
+    # Reuse an already checked maze, preferring one that has pockets
+    maze, reachable = next(((maze, reachable) for maze, reachable in results
+                            if reachable.count(1) < count_path_cells(maze)), results[0])
+    visualize_reachability(maze, reachable)
 
     print("=" * 60)
     if all_connected:
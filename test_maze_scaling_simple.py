@@ -32,10 +32,13 @@ print(f"Base tile size: {base_tile_size}px")
 print("=" * 70)
 print()
 
-for grid_size, description in test_cases:
-    tile_size = calculate_tile_size(grid_size, window_width, window_height, base_tile_size)
-    offset_x, offset_y = calculate_offsets(grid_size, tile_size, window_width, window_height)
+# Work out every level's layout in one sweep, then report
+tile_sizes = [calculate_tile_size(grid_size, window_width, window_height, base_tile_size)
+              for grid_size, _ in test_cases]
+offsets = [calculate_offsets(grid_size, tile_size, window_width, window_height)
+           for (grid_size, _), tile_size in zip(test_cases, tile_sizes)]
 
+for (grid_size, description), tile_size, (offset_x, offset_y) in zip(test_cases, tile_sizes, offsets):
     maze_width = grid_size * tile_size
     maze_height = grid_size * tile_size
     total_width = offset_x * 2 + maze_width
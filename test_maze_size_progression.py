@@ -15,6 +15,16 @@ from systems.game_state import GameState
 from systems.fact_loader import FactLoader
 
 
+def progression_sizes(levels, size_min, size_max, progression_levels):
+    """Grid size for each level: a linear ramp up to progression_levels, then the
+    maximum, with even sizes bumped to the next odd number."""
+    span = max(progression_levels - 1, 1)
+    sizes = [size_max if level >= progression_levels
+             else int(size_min + (level - 1) / span * (size_max - size_min))
+             for level in levels]
+    return [size | 1 for size in sizes]
+
+
 def test_maze_progression():
     """Test and display maze size progression over levels."""
     # Load config
@@ -41,10 +51,17 @@ def test_maze_progression():
     print(f"{'Level':<8} {'Grid Size':<12} {'Total Cells':<12} {'Visual'}")
     print("-" * 60)
 
-    # Test first 25 levels to show progression and plateau
-    for level in range(1, 26):
+    # Test first 25 levels to show progression and plateau. The sizes come
+    # from the closed form (linear ramp, bumped to odd, then a plateau) and
+    # are checked against GameState before printing.
+    levels = range(1, 26)
+    sizes = progression_sizes(levels, game_state.grid_size_min, game_state.grid_size_max,
+                              game_state.grid_size_progression_levels)
+    for level, grid_size in zip(levels, sizes):
         game_state.current_level = level
-        grid_size = game_state.get_grid_size_for_level()
+        assert grid_size == game_state.get_grid_size_for_level(), f"Level {level} size mismatch"
+
+    for level, grid_size in zip(levels, sizes):
         total_cells = grid_size * grid_size
 
         # Visual representation (each █ = 2x2 cells)
@@ -21,6 +21,10 @@ def check_vertical_mirroring(grid, grid_size):
     center = grid_size // 2
     errors = []
 
+    # Whole-row slice comparison first; only walk cells to report mismatches
+    if all(row[:center] == row[grid_size - 1:grid_size - 1 - center:-1] for row in grid):
+        return True, errors
+
     # Check that left side mirrors to right side
     for i in range(center):
         mirror_i = grid_size - 1 - i
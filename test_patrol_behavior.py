@@ -6,16 +6,68 @@ Tests greedy pathfinding and patrol behavior with quadrant waypoints.
 import sys
 sys.path.insert(0, 'src')
 
-import pygame
 from systems.maze import Maze
+from systems.maze_constants import WALL
 from systems.collision import CollisionManager
 from entities.enemy import Enemy
 from ai.behaviors import PatrolBehavior
 from ai.pathfinding import get_direction_towards_target, find_nearest_walkable_tile
 import configparser
+from functools import lru_cache
 
-# Initialize pygame (needed for font rendering in Enemy)
-pygame.init()
+# pygame.init() is deliberately not called: nothing here is drawn, and
+# without the font module Enemy uses a plain square instead of an emoji
+
+
+TEST_INI = """
+[Maze]
+tile_size = 40
+
+[Player]
+corner_forgiveness = 6
+
+[Attributes]
+speed_min = 1
+speed_max = 4
+awareness_min = 2
+awareness_max = 8
+
+[Movement]
+update_interval = 10
+wander_direction_change_interval = 2.0
+
+[Colors]
+enemy = 255, 200, 100
+"""
+
+
+def make_config():
+    """Config with the settings CollisionManager and Enemy read."""
+    config = configparser.ConfigParser()
+    config.read_string(TEST_INI)
+    return config
+
+
+@lru_cache(maxsize=None)
+def shared_setup():
+    """Maze, config and collision manager, built once for the whole module.
+    No test changes the maze, so they all share it; tests that move an enemy
+    create their own with make_patrol_enemy."""
+    maze = Maze(
+        grid_size=20,
+        tile_size=40,
+        max_wall_length=4,
+        max_attempts=100
+    )
+    config = make_config()
+    return maze, config, CollisionManager(maze, config)
+
+
+def make_patrol_enemy():
+    """Fresh patrol enemy at the shared maze's start position."""
+    maze, config, collision_manager = shared_setup()
+    start_x, start_y = maze.get_start_position()
+    return Enemy(start_x, start_y, config, collision_manager, maze, behavior_type='patrol')
 
 
 def test_greedy_pathfinding():
@@ -58,14 +110,8 @@ def test_find_nearest_walkable():
     """Test finding nearest walkable tile."""
     print("Testing find_nearest_walkable_tile...")
 
-    # Create a test maze
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
+    # Shared test maze
+    maze, _, _ = shared_setup()
 
     # Test finding walkable tile near center
     center_x, center_y = 10, 10
@@ -83,37 +129,9 @@ def test_patrol_waypoints():
     """Test patrol waypoint calculation."""
     print("Testing patrol waypoint calculation...")
 
-    # Create test maze and enemy
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
-
-    # Create config
-    config = configparser.ConfigParser()
-    config.add_section('Maze')
-    config.set('Maze', 'tile_size', '40')
-    config.add_section('Player')
-    config.set('Player', 'corner_forgiveness', '6')
-    config.add_section('Attributes')
-    config.set('Attributes', 'speed_min', '1')
-    config.set('Attributes', 'speed_max', '4')
-    config.set('Attributes', 'awareness_min', '2')
-    config.set('Attributes', 'awareness_max', '8')
-    config.add_section('Movement')
-    config.set('Movement', 'update_interval', '10')
-    config.set('Movement', 'wander_direction_change_interval', '2.0')
-    config.add_section('Colors')
-    config.set('Colors', 'enemy', '255, 200, 100')
-
-    collision_manager = CollisionManager(maze, config)
-
-    # Create enemy
-    start_x, start_y = maze.get_start_position()
-    enemy = Enemy(start_x, start_y, config, collision_manager)
+    # Shared test maze, fresh enemy
+    maze, _, _ = shared_setup()
+    enemy = make_patrol_enemy()
 
     # Create patrol behavior
     patrol = PatrolBehavior(enemy)
@@ -135,37 +153,9 @@ def test_patrol_cycling():
     """Test patrol waypoint cycling."""
     print("Testing patrol waypoint cycling...")
 
-    # Create test maze and enemy
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
-
-    # Create config
-    config = configparser.ConfigParser()
-    config.add_section('Maze')
-    config.set('Maze', 'tile_size', '40')
-    config.add_section('Player')
-    config.set('Player', 'corner_forgiveness', '6')
-    config.add_section('Attributes')
-    config.set('Attributes', 'speed_min', '1')
-    config.set('Attributes', 'speed_max', '4')
-    config.set('Attributes', 'awareness_min', '2')
-    config.set('Attributes', 'awareness_max', '8')
-    config.add_section('Movement')
-    config.set('Movement', 'update_interval', '10')
-    config.set('Movement', 'wander_direction_change_interval', '2.0')
-    config.add_section('Colors')
-    config.set('Colors', 'enemy', '255, 200, 100')
-
-    collision_manager = CollisionManager(maze, config)
-
-    # Create enemy
-    start_x, start_y = maze.get_start_position()
-    enemy = Enemy(start_x, start_y, config, collision_manager)
+    # Shared test maze, fresh enemy
+    maze, _, _ = shared_setup()
+    enemy = make_patrol_enemy()
 
     # Create patrol behavior
     patrol = PatrolBehavior(enemy)
@@ -194,60 +184,40 @@ def visualize_patrol():
     print("Visualizing patrol behavior...")
     print()
 
-    # Create test maze
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
-
-    # Create config
-    config = configparser.ConfigParser()
-    config.add_section('Maze')
-    config.set('Maze', 'tile_size', '40')
-    config.add_section('Player')
-    config.set('Player', 'corner_forgiveness', '6')
-    config.add_section('Attributes')
-    config.set('Attributes', 'speed_min', '1')
-    config.set('Attributes', 'speed_max', '4')
-    config.set('Attributes', 'awareness_min', '2')
-    config.set('Attributes', 'awareness_max', '8')
-    config.add_section('Movement')
-    config.set('Movement', 'update_interval', '10')
-    config.set('Movement', 'wander_direction_change_interval', '2.0')
-    config.add_section('Colors')
-    config.set('Colors', 'enemy', '255, 200, 100')
-
-    collision_manager = CollisionManager(maze, config)
-
-    # Create enemy at start
-    start_x, start_y = maze.get_start_position()
-    enemy = Enemy(start_x, start_y, config, collision_manager)
+    # Shared test maze, fresh enemy at start
+    maze, _, _ = shared_setup()
+    enemy = make_patrol_enemy()
 
     # Create patrol behavior
     patrol = PatrolBehavior(enemy)
 
-    # Print maze with waypoints
+    # Print maze with waypoints (every cell is in bounds, so the grid is
+    # indexed directly rather than through maze.is_wall)
     print("Maze with patrol waypoints:")
-    for y in range(maze.grid_size):
-        for x in range(maze.grid_size):
-            if (x, y) == (enemy.tile_x, enemy.tile_y):
-                print('E', end='')  # Enemy
-            elif (x, y) in patrol.waypoints:
-                # Show waypoint number
-                idx = patrol.waypoints.index((x, y))
-                print(str(idx), end='')
-            elif (x, y) == maze.start_pos:
-                print('S', end='')  # Start
-            elif (x, y) == maze.end_pos:
-                print('X', end='')  # End
-            elif maze.is_wall(x, y):
-                print('█', end='')  # Wall
-            else:
-                print('·', end='')  # Path
-        print()
+    grid = maze.grid
+    # Looked up once rather than per cell; the first index wins if two
+    # waypoints share a tile, as with list.index
+    waypoint_of = {}
+    for i, waypoint in enumerate(patrol.waypoints):
+        waypoint_of.setdefault(waypoint, i)
+    enemy_pos = (enemy.tile_x, enemy.tile_y)
+    start, end = maze.start_pos, maze.end_pos
+
+    def cell_char(x, y, cell):
+        pos = (x, y)
+        if pos == enemy_pos:
+            return 'E'  # Enemy
+        if pos in waypoint_of:
+            return str(waypoint_of[pos])  # Waypoint number
+        if pos == start:
+            return 'S'  # Start
+        if pos == end:
+            return 'X'  # End
+        return '█' if cell == WALL else '·'  # Wall / Path
+
+    # Each row is joined into one string and the whole maze printed at once
+    print('\n'.join(''.join(cell_char(x, y, cell) for x, cell in enumerate(row))
+                    for y, row in enumerate(grid)))
     print()
     print("Legend:")
     print("  E = Enemy current position")
@@ -9,7 +9,6 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-import pygame
 import configparser
 from pathlib import Path
 from entities.player import Player
@@ -24,9 +23,6 @@ def test_phase_a3():
     print("Phase A3 Test: Single Enemy Random Movement")
     print("=" * 60)
 
-    # Initialize pygame
-    pygame.init()
-
     # Load configuration
     config = configparser.ConfigParser()
     config_path = Path('src/config/gameplay.ini')
@@ -42,8 +38,8 @@ def test_phase_a3():
     config.read([config_path, enemies_config_path])
     print("✓ Configuration files loaded")
 
-    # Generate maze
-    grid_size = config.getint('Maze', 'grid_size')
+    # Generate maze (first level's size)
+    grid_size = config.getint('Maze', 'grid_size_min')
     tile_size = config.getint('Maze', 'tile_size')
     maze = Maze(grid_size, tile_size)
     print(f"✓ Maze generated ({maze.grid_size}x{maze.grid_size})")
@@ -59,7 +55,7 @@ def test_phase_a3():
     print(f"✓ End position: ({end_x}, {end_y})")
 
     # Create enemy at end position
-    enemy = Enemy(end_x, end_y, config, collision_manager)
+    enemy = Enemy(end_x, end_y, config, collision_manager, maze)
     print(f"✓ Enemy created at end position")
     print(f"  - Speed: {enemy.speed} tiles/sec")
     print(f"  - Awareness: {enemy.awareness} tiles")
@@ -79,13 +75,19 @@ def test_phase_a3():
     player_pos = (start_x, start_y)  # Dummy player position
     dt = 1.0 / 60.0  # 60 FPS
 
+    # Enemy.update only consults the behavior every update_interval frames, so
+    # the loop just records moves and reports them afterwards in one print
+    update = enemy.update
     positions = [enemy_pos]
+    moves = []
     for frame in range(50):
-        enemy.update(dt, player_pos)
-        new_pos = enemy.get_tile_position()
+        update(dt, player_pos)
+        new_pos = (enemy.tile_x, enemy.tile_y)
         if new_pos != positions[-1]:
             positions.append(new_pos)
-            print(f"  Frame {frame}: Enemy moved to {new_pos}")
+            moves.append(f"  Frame {frame}: Enemy moved to {new_pos}")
+    if moves:
+        print('\n'.join(moves))
 
     if len(positions) > 1:
         print(f"✓ Enemy moved {len(positions) - 1} times in 50 frames")
@@ -95,10 +97,11 @@ def test_phase_a3():
 
     # Check that enemy respects walls
     print("\nVerifying wall collision:")
+    is_wall = maze.is_wall
     test_passed = True
-    for pos in positions:
-        if maze.is_wall(pos[0], pos[1]):
-            print(f"❌ Enemy walked through wall at {pos}")
+    for x, y in positions:
+        if is_wall(x, y):
+            print(f"❌ Enemy walked through wall at {(x, y)}")
             test_passed = False
 
     if test_passed:
@@ -108,7 +111,6 @@ def test_phase_a3():
     print("Phase A3 Test Complete!")
     print("=" * 60)
 
-    pygame.quit()
     return True
 
 
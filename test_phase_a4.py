@@ -6,30 +6,32 @@ import sys
 sys.path.insert(0, 'src')
 
 from systems.maze import Maze
-import configparser
+from systems.maze_constants import WALL
+from functools import lru_cache
 
-def test_maze_generation():
-    """Test Pac-Man style maze generation."""
-    print("Testing Pac-Man style maze generation...")
 
-    # Create maze with test parameters
-    maze = Maze(
+@lru_cache(maxsize=None)
+def shared_maze():
+    """One maze for the whole module; the tests only read it."""
+    return Maze(
         grid_size=20,
         tile_size=40,
-        wall_density=0.2,
         max_wall_length=4,
         max_attempts=100
     )
 
+
+def test_maze_generation():
+    """Test Pac-Man style maze generation."""
+    print("Testing Pac-Man style maze generation...")
+
+    # Shared test maze
+    maze = shared_maze()
+
     # Count walls
-    wall_count = 0
+    wall_count = sum(row.count(1) for row in maze.grid)  # 1 = WALL
     total_cells = maze.grid_size * maze.grid_size
 
-    for row in maze.grid:
-        for cell in row:
-            if cell == 1:  # WALL
-                wall_count += 1
-
     actual_density = wall_count / total_cells
 
     print(f"  Grid size: {maze.grid_size}x{maze.grid_size}")
@@ -64,26 +66,22 @@ def visualize_maze():
     print("Sample Pac-Man style maze (20x20, 20% walls):")
     print()
 
-    maze = Maze(
-        grid_size=20,
-        tile_size=40,
-        wall_density=0.2,
-        max_wall_length=4,
-        max_attempts=100
-    )
+    maze = shared_maze()
+
+    # Print maze (every cell is in bounds, so the grid is indexed directly)
+    grid = maze.grid
+    start, end = maze.start_pos, maze.end_pos
+
+    def cell_char(x, y, cell):
+        if (x, y) == start:
+            return 'S'  # Start
+        if (x, y) == end:
+            return 'E'  # End
+        return '█' if cell == WALL else '·'  # Wall / Path
 
-    # Print maze
-    for y in range(maze.grid_size):
-        for x in range(maze.grid_size):
-            if (x, y) == maze.start_pos:
-                print('S', end='')  # Start
-            elif (x, y) == maze.end_pos:
-                print('E', end='')  # End
-            elif maze.is_wall(x, y):
-                print('█', end='')  # Wall
-            else:
-                print('·', end='')  # Path
-        print()
+    # Each row is joined into one string and the whole maze printed at once
+    print('\n'.join(''.join(cell_char(x, y, cell) for x, cell in enumerate(row))
+                    for y, row in enumerate(grid)))
     print()
     print("Legend: S=Start, E=End, █=Wall, ·=Path")
     print()